@@ -17,7 +17,7 @@ from routes import auth_bp, booking_bp, admin_bp, api_bp
 
 # Import services
 from services.slot_service import SlotService
-from utils.datetime_utils import get_eastern_now, get_eastern_datetime
+from utils.datetime_utils import TimezoneUtil
 
 # Load environment variables
 load_dotenv()
@@ -44,22 +44,6 @@ app.config['PERMANENT_SESSION_LIFETIME'] = 86400  # 24 hours
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000  # 1 year cache for static files
 
-# ============================================================================
-# TIMEZONE UTILITY WRAPPER
-# ============================================================================
-
-class TimezoneUtil:
-    """Wrapper for timezone utilities to maintain backward compatibility"""
-    
-    @staticmethod
-    def get_eastern_now():
-        return get_eastern_now()
-    
-    @staticmethod
-    def get_eastern_datetime(dt_str):
-        return get_eastern_datetime(dt_str)
-
-
 # ============================================================================
 # SERVICE INITIALIZATION
 # ============================================================================
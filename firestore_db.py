@@ -6,12 +6,13 @@ This module handles all Firestore database operations, replacing JSON file stora
 
 import os
 import json
+import time
 import base64
 import firebase_admin
 from firebase_admin import credentials, firestore
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional, Tuple
-import pytz
+from utils.datetime_utils import EASTERN_TZ
 
 # Global Firestore client
 db = None
@@ -120,6 +121,42 @@ def get_all_bookings() -> List[Dict]:
         return []
 
 
+def get_bookings_in_range(start_iso: str, end_iso: str) -> List[Dict]:
+    """
+    Get bookings whose slot datetime falls in [start_iso, end_iso).
+
+    Slot datetimes are stored as Eastern ISO strings, so a lexicographic
+    range on 'slot_details.datetime' selects by Eastern date/time.
+
+    Args:
+        start_iso: Inclusive lower bound (e.g. '2025-01-20')
+        end_iso: Exclusive upper bound (e.g. '2025-01-21')
+
+    Returns:
+        List of booking dictionaries
+    """
+    db = get_firestore_client()
+    if db is None:
+        return []
+
+    try:
+        query = (db.collection('bookings')
+                 .where('slot_details.datetime', '>=', start_iso)
+                 .where('slot_details.datetime', '<', end_iso))
+
+        bookings = []
+        for doc in query.stream():
+            booking = doc.to_dict()
+            booking['id'] = doc.id  # Add document ID
+            bookings.append(booking)
+
+        return bookings
+
+    except Exception as e:
+        print(f"Error getting bookings in range: {e}")
+        return []
+
+
 def add_booking(booking_data: Dict) -> Optional[str]:
     """
     Add a new booking to Firestore.
@@ -240,6 +277,31 @@ def delete_booking(booking_id: str) -> bool:
 # TIME SLOTS OPERATIONS
 # ============================================================================
 
+# Short-lived cache behind get_all_slots_cached(), for maintenance and admin
+# listing reads only. Anything that decides whether a slot can be booked must
+# use the uncached get_all_slots()/get_slot(): other workers don't see this
+# process's invalidations. Cleared on slot writes made by this process.
+SLOTS_CACHE_TTL = 5  # seconds
+_slots_cache = None
+_slots_cache_time = 0.0
+
+
+def invalidate_slots_cache():
+    """Drop the cached get_all_slots_cached() result."""
+    global _slots_cache
+    _slots_cache = None
+
+
+def _fetch_all_slots(db) -> List[Dict]:
+    """Read every time slot from Firestore, sorted by datetime."""
+    slots = []
+    for doc in db.collection('time_slots').order_by('datetime').stream():
+        slot = doc.to_dict()
+        slot['doc_id'] = doc.id  # Store Firestore doc ID separately
+        slots.append(slot)
+    return slots
+
+
 def get_all_slots() -> List[Dict]:
     """
     Get all time slots from Firestore.
@@ -252,22 +314,83 @@ def get_all_slots() -> List[Dict]:
         return []
 
     try:
-        slots_ref = db.collection('time_slots')
-        docs = slots_ref.order_by('datetime').stream()
+        return _fetch_all_slots(db)
 
-        slots = []
-        for doc in docs:
-            slot = doc.to_dict()
-            slot['doc_id'] = doc.id  # Store Firestore doc ID separately
-            slots.append(slot)
+    except Exception as e:
+        print(f"Error getting slots: {e}")
+        return []
+
+
+def get_all_slots_cached() -> List[Dict]:
+    """
+    Get all time slots, reusing a result up to SLOTS_CACHE_TTL seconds old.
+
+    Only for maintenance and admin listing reads; never use it to decide
+    whether a slot is still free. Callers receive copies.
+
+    Returns:
+        List of time slot dictionaries, sorted by datetime
+    """
+    global _slots_cache, _slots_cache_time
 
-        return slots
+    if _slots_cache is not None and time.monotonic() - _slots_cache_time < SLOTS_CACHE_TTL:
+        return [dict(slot) for slot in _slots_cache]
+
+    db = get_firestore_client()
+    if db is None:
+        return []
+
+    try:
+        slots = _fetch_all_slots(db)
+        _slots_cache = slots
+        _slots_cache_time = time.monotonic()
+        return [dict(slot) for slot in slots]
 
     except Exception as e:
         print(f"Error getting slots: {e}")
         return []
 
 
+def has_any_slot() -> bool:
+    """
+    Check whether at least one time slot exists.
+
+    Returns:
+        True if the time_slots collection is non-empty, False otherwise
+    """
+    db = get_firestore_client()
+    if db is None:
+        return False
+
+    try:
+        return next(db.collection('time_slots').limit(1).stream(), None) is not None
+
+    except Exception as e:
+        print(f"Error checking for slots: {e}")
+        return False
+
+
+def get_available_slots_raw(limit: Optional[int] = None) -> List[Dict]:
+    """
+    Get unbooked time slots, sorted by datetime.
+
+    Unlike get_available_slots(), past slots are not excluded. Filters the
+    get_all_slots() result in Python (avoids complex Firestore index).
+
+    Args:
+        limit: Optional maximum number of slots to return
+
+    Returns:
+        List of unbooked slot dictionaries, sorted by datetime
+    """
+    # get_all_slots() is already ordered by datetime
+    slots = [slot for slot in get_all_slots() if not slot.get('booked', False)]
+
+    if limit:
+        return slots[:limit]
+    return slots
+
+
 def get_available_slots() -> List[Dict]:
     """Get only available (not booked) time slots."""
     db = get_firestore_client()
@@ -275,20 +398,17 @@ def get_available_slots() -> List[Dict]:
         return []
 
     try:
-        # Get all slots and filter in Python (avoids complex Firestore index)
-        all_slots = get_all_slots()
+        # Unbooked slots in datetime order, filtered in Python from the full
+        # slot list (avoids complex Firestore index)
+        unbooked_slots = get_available_slots_raw()
 
         # Get current time in Eastern timezone
-        eastern = pytz.timezone('America/New_York')
+        eastern = EASTERN_TZ
         now_eastern = datetime.now(eastern)
 
         # Filter for available slots in the future
         available_slots = []
-        for slot in all_slots:
-            # Skip booked slots
-            if slot.get('booked', False):
-                continue
-
+        for slot in unbooked_slots:
             slot_datetime_str = slot.get('datetime', '')
             if not slot_datetime_str:
                 continue
@@ -298,7 +418,7 @@ def get_available_slots() -> List[Dict]:
                 slot_dt = datetime.fromisoformat(slot_datetime_str)
                 if slot_dt.tzinfo is None:
                     # If no timezone info, assume Eastern
-                    slot_dt = eastern.localize(slot_dt)
+                    slot_dt = slot_dt.replace(tzinfo=eastern)
                 else:
                     # Convert to Eastern for comparison
                     slot_dt = slot_dt.astimezone(eastern)
@@ -310,9 +430,6 @@ def get_available_slots() -> List[Dict]:
                 print(f"Warning: Could not parse slot datetime {slot_datetime_str}: {e}")
                 continue
 
-        # Sort by datetime
-        available_slots.sort(key=lambda x: x.get('datetime', ''))
-
         return available_slots
 
     except Exception as e:
@@ -320,6 +437,65 @@ def get_available_slots() -> List[Dict]:
         return []
 
 
+def get_slot(slot_id: str) -> Optional[Dict]:
+    """
+    Get a single time slot by ID.
+
+    Args:
+        slot_id: The slot ID (also the Firestore document ID)
+
+    Returns:
+        Slot dictionary, or None if not found
+    """
+    db = get_firestore_client()
+    if db is None:
+        return None
+
+    try:
+        doc = db.collection('time_slots').document(slot_id).get()
+
+        if doc.exists:
+            slot = doc.to_dict()
+            slot['doc_id'] = doc.id
+            return slot
+        return None
+
+    except Exception as e:
+        print(f"Error getting slot: {e}")
+        return None
+
+
+def count_slots(booked_only: bool = False) -> Optional[int]:
+    """
+    Count time slots using a server-side aggregation query.
+
+    There is deliberately no "unbooked" filter: documents without a 'booked'
+    field count as available but would not match booked == False, so derive
+    available counts as total - booked.
+
+    Args:
+        booked_only: Only count slots with booked == True
+
+    Returns:
+        Number of matching slots, or None on error
+    """
+    db = get_firestore_client()
+    if db is None:
+        return None
+
+    try:
+        query = db.collection('time_slots')
+        if booked_only:
+            query = query.where('booked', '==', True)
+
+        result = query.count().get()
+        return int(result[0][0].value)
+
+    except Exception as e:
+        print(f"Error counting slots: {e}")
+        return None
+
+
 def add_time_slot(slot_data: Dict) -> Optional[str]:
     """
     Add a new time slot to Firestore.
@@ -346,8 +522,7 @@ def add_time_slot(slot_data: Dict) -> Optional[str]:
                     # No timezone info, assume it's meant to be Eastern time
                     # Parse as naive datetime and add Eastern timezone
                     dt = datetime.fromisoformat(datetime_str)
-                    eastern = pytz.timezone('America/New_York')
-                    dt_eastern = eastern.localize(dt)
+                    dt_eastern = dt.replace(tzinfo=EASTERN_TZ)
                     # Store as ISO format with timezone
                     slot_data['datetime'] = dt_eastern.isoformat()
             except Exception as e:
@@ -367,6 +542,7 @@ def add_time_slot(slot_data: Dict) -> Optional[str]:
 
         # Add the slot
         doc_ref.set(slot_data)
+        invalidate_slots_cache()
         print(f"OK: Time slot added: {slot_id}")
         return slot_id
 
@@ -393,6 +569,7 @@ def update_slot(slot_id: str, update_data: Dict) -> bool:
     try:
         doc_ref = db.collection('time_slots').document(slot_id)
         doc_ref.update(update_data)
+        invalidate_slots_cache()
         print(f"OK: Slot updated: {slot_id}")
         return True
 
@@ -417,6 +594,7 @@ def delete_slot(slot_id: str) -> bool:
 
     try:
         db.collection('time_slots').document(slot_id).delete()
+        invalidate_slots_cache()
         print(f"OK: Slot deleted: {slot_id}")
         return True
 
@@ -460,6 +638,7 @@ def book_slot(slot_id: str, user_email: str, room: str) -> bool:
             'booked_by': user_email,
             'room': room
         })
+        invalidate_slots_cache()
 
         print(f"OK: Slot {slot_id} booked for {user_email}")
         return True
@@ -490,6 +669,7 @@ def unbook_slot(slot_id: str) -> bool:
             'booked_by': None,
             'room': None
         })
+        invalidate_slots_cache()
         print(f"OK: Slot unboked: {slot_id}")
         return True
 
@@ -65,13 +65,12 @@ class RateLimiter:
         Get unique client identifier for rate limiting
         Uses IP address with X-Forwarded-For support
         """
-        if request.headers.get('X-Forwarded-For'):
-            # Behind proxy - get real IP
-            ip = request.headers.get('X-Forwarded-For').split(',')[0].strip()
-        elif request.headers.get('X-Real-IP'):
-            ip = request.headers.get('X-Real-IP')
+        forwarded_for = request.headers.get('X-Forwarded-For')
+        if forwarded_for:
+            # Behind proxy - get real IP (first hop only)
+            ip = forwarded_for.partition(',')[0].strip()
         else:
-            ip = request.remote_addr or 'unknown'
+            ip = request.headers.get('X-Real-IP') or request.remote_addr or 'unknown'
 
         return ip
 
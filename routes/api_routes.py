@@ -14,17 +14,7 @@ from middleware.rate_limit import rate_limit
 from utils import get_eastern_now
 from services.slot_service import SlotService
 from services.email_service import EmailService
-from utils.datetime_utils import get_eastern_now as tz_get_eastern_now, get_eastern_datetime
-
-# Initialize timezone utility wrapper
-class TimezoneUtil:
-    @staticmethod
-    def get_eastern_now():
-        return tz_get_eastern_now()
-    
-    @staticmethod
-    def get_eastern_datetime(dt_str):
-        return get_eastern_datetime(dt_str)
+from utils.datetime_utils import EASTERN_TZ, UTC_TZ, TimezoneUtil, get_eastern_datetime
 
 # Initialize slot service
 tz_util = TimezoneUtil()
@@ -153,7 +143,8 @@ def manage_slots():
         tutor_role = session.get('tutor_role', 'admin')
         tutor_id = session.get('tutor_id')
 
-        all_slots = db.get_all_slots()
+        # Listing only; a few seconds of staleness is fine here
+        all_slots = db.get_all_slots_cached()
         now_eastern = get_eastern_now()
 
         # Filter to only show future slots in Eastern time
@@ -578,7 +569,6 @@ def delete_slots_range():
     """Delete slots within a date range or based on weeks"""
     try:
         from datetime import timedelta
-        import pytz
         
         data = request.json
         mode = data.get('mode', 'date_range')
@@ -590,7 +580,7 @@ def delete_slots_range():
             # Delete slots that are further than N weeks in the future
             weeks = data.get('weeks', 6)
             
-            eastern = pytz.timezone('America/New_York')
+            eastern = EASTERN_TZ
             now = datetime.now(eastern)
             cutoff_date = now + timedelta(weeks=weeks)
             
@@ -601,7 +591,7 @@ def delete_slots_range():
                         # Parse the slot datetime
                         slot_dt = datetime.fromisoformat(slot_datetime_str)
                         if slot_dt.tzinfo is None:
-                            slot_dt = pytz.utc.localize(slot_dt)
+                            slot_dt = slot_dt.replace(tzinfo=UTC_TZ)
                         slot_dt_eastern = slot_dt.astimezone(eastern)
                         
                         # Only delete unbooked slots that are beyond the cutoff
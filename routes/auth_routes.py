@@ -6,7 +6,7 @@ Handles OAuth login, callback, logout, and access checking.
 from flask import Blueprint, request, session, redirect, url_for, jsonify, render_template
 from services.auth_service import AuthService
 import firestore_db as db
-import random
+from utils.security_utils import generate_verification_token
 import os
 from datetime import datetime, timedelta
 
@@ -366,7 +366,7 @@ def admin_verify():
             error = 'Invalid or expired verification code. Please try again.'
 
     if request.method == 'GET' or error:
-        code = ''.join([str(random.randint(0, 9)) for _ in range(6)])
+        code = generate_verification_token()
         db.store_admin_verification_code(pending_email, code)
 
         from services.email_service import EmailService
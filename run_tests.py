@@ -17,6 +17,10 @@ def run_tests(args):
     if args.verbose:
         cmd.append('-v')
 
+    # Run in parallel (one worker per CPU, each test file kept on one worker)
+    if args.parallel:
+        cmd.extend(['-n', 'auto', '--dist', 'loadfile'])
+
     # Add coverage
     if args.coverage:
         cmd.extend(['--cov=.', '--cov-report=html', '--cov-report=term-missing'])
@@ -92,6 +96,8 @@ def main():
                        help='Run only failed tests from last run')
     parser.add_argument('-x', '--stop', action='store_true',
                        help='Stop on first failure')
+    parser.add_argument('-p', '--parallel', action='store_true',
+                       help='Run tests in parallel with pytest-xdist')
     parser.add_argument('-s', '--security', action='store_true',
                        help='Run security scans')
     parser.add_argument('-a', '--all', action='store_true',
@@ -1,98 +1,44 @@
-import os
 import sys
-from datetime import datetime, time
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 import firestore_db as db
-from app import send_booking_reminder_email, initialize_email_config
-from timezone_utils import get_eastern_now
+from services.slot_service import SlotService
+from utils.datetime_utils import TimezoneUtil
 
 
 def send_daily_reminders():
     """
-    Check for bookings scheduled for today and send reminder emails at 8:30 AM.
+    Send reminder emails for bookings scheduled today (Eastern Time).
+
+    Standalone entry point for an external scheduler; uses the same
+    SlotService path as the /api/cron/send-reminders endpoint.
     """
     try:
-        initialize_email_config()
-
-        # Use Eastern Time for all date/time operations
-        now_eastern = get_eastern_now()
+        tz_util = TimezoneUtil()
+        now_eastern = tz_util.get_eastern_now()
 
         print(f"\n{'='*60}")
         print(f"Daily Reminder Email Job - {now_eastern.strftime('%Y-%m-%d %H:%M:%S')} ET")
         print(f"{'='*60}\n")
 
-        # Get all bookings
-        bookings = db.get_all_bookings()
-        print(f"Found {len(bookings)} total bookings")
-
-        # Get today's date for comparison (in Eastern Time)
-        today = now_eastern.strftime('%Y-%m-%d')
-        print(f"Looking for bookings scheduled for: {today} (Eastern Time)\n")
-
-        # Track reminders sent
-        reminders_sent = 0
-        reminders_skipped = 0
-
-        # Check each booking
-        for booking in bookings:
-            try:
-                slot_details = booking.get('slot_details', {})
-                booking_datetime_str = slot_details.get('datetime', '')
-                
-                if not booking_datetime_str:
-                    print(f"⚠️  Skipping booking (no datetime): {booking.get('id')}")
-                    reminders_skipped += 1
-                    continue
-
-                # Parse the booking datetime
-                booking_date = booking_datetime_str[:10]  # Extract YYYY-MM-DD
-                booking_id = booking.get('id', 'unknown')
-                user_name = booking.get('full_name', 'User')
-                user_email = booking.get('email', '')
-
-                # Check if booking is for today
-                if booking_date == today:
-                    print(f"📧 Found booking for today: {booking_id}")
-                    print(f"   Name: {user_name}")
-                    print(f"   Email: {user_email}")
-                    print(f"   Time: {slot_details.get('time', 'N/A')}")
-
-                    # Send reminder email
-                    try:
-                        email_sent = send_booking_reminder_email(booking)
-                        if email_sent:
-                            print(f"   ✅ Reminder email sent successfully\n")
-                            reminders_sent += 1
-                        else:
-                            print(f"   ❌ Failed to send reminder email\n")
-                            reminders_skipped += 1
-                    except Exception as email_error:
-                        print(f"   ❌ Exception sending reminder: {email_error}\n")
-                        reminders_skipped += 1
-
-            except Exception as booking_error:
-                print(f"❌ Error processing booking: {booking_error}")
-                reminders_skipped += 1
-                continue
+        reminders_sent = SlotService(db, tz_util).check_and_send_meeting_reminders()
 
         # Print summary
         print(f"{'='*60}")
         print(f"Summary:")
         print(f"  ✅ Reminders sent: {reminders_sent}")
-        print(f"  ⚠️  Reminders skipped: {reminders_skipped}")
         print(f"{'='*60}\n")
 
-        return reminders_sent, reminders_skipped
+        return reminders_sent
 
     except Exception as e:
         print(f"❌ ERROR: Failed to send daily reminders: {e}")
         import traceback
         traceback.print_exc()
-        return 0, 0
+        return 0
 
 
 if __name__ == '__main__':
@@ -4,10 +4,17 @@ Handles time slot management, generation, cleanup, and reminders.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from .email_service import EmailService
 
+# Static name tables so slot labels don't go through locale-aware strftime per slot
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
 
 class SlotService:
     """Service for managing booking time slots"""
@@ -23,11 +30,35 @@ class SlotService:
         self.db = db
         self.tz = timezone_util
         self.last_auto_cleanup = None
+        # Memoized ISO string -> aware datetime parser; cleanup runs see the same slots repeatedly
+        self._parse_eastern = lru_cache(maxsize=4096)(self._parse_slot_datetime)
+
+    def _parse_slot_datetime(self, datetime_str: str) -> Optional[datetime]:
+        """
+        Parse a slot datetime string for comparison against Eastern "now"
+
+        Slots are stored with their UTC offset, and aware datetimes compare
+        correctly across zones, so those skip the astimezone() conversion.
+        Naive strings go through the timezone utility as before.
+
+        Args:
+            datetime_str: ISO format datetime string
+
+        Returns:
+            Timezone-aware datetime (not necessarily in Eastern), or None if the
+            string cannot be parsed
+        """
+        try:
+            dt = datetime.fromisoformat(datetime_str)
+        except (ValueError, TypeError):
+            return None
+        if dt.tzinfo is not None:
+            return dt
+        return self.tz.get_eastern_datetime(datetime_str)
 
     def init_slots(self) -> None:
         """Check if time slots exist - admin controls generation now"""
-        slots = self.db.get_all_slots()
-        if len(slots) == 0:
+        if not self.db.has_any_slot():
             print("No time slots found. Admin can generate slots from dashboard.")
 
     def generate_slots(self, weeks_ahead: int = 6, weekly_schedule: Optional[Dict] = None,
@@ -49,16 +80,11 @@ class SlotService:
         Returns:
             List of slot dictionaries with datetime, day, date, time, tutor info, etc.
         """
-        # DEBUG: Log received parameters
-        print(f"[DEBUG] SlotService.generate_slots called with:")
-        print(f"[DEBUG]   tutor_id: {tutor_id}")
-        print(f"[DEBUG]   tutor_name: {tutor_name}")
-        print(f"[DEBUG]   tutor_email: {tutor_email}")
-
         slots = []
 
-        # Start from today in Eastern time
-        start_date = self.tz.get_eastern_now().replace(hour=0, minute=0, second=0, microsecond=0)
+        # Start from today in Eastern time (resolved once; reused for the future-slot check)
+        now_eastern = self.tz.get_eastern_now()
+        start_date = now_eastern.replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Use custom schedule if provided, otherwise use default
         if weekly_schedule is None:
@@ -73,53 +99,64 @@ class SlotService:
             # Convert string keys to integers (JSON converts dict keys to strings)
             weekly_schedule = {int(k): v for k, v in weekly_schedule.items()}
 
-        # Generate slots for specified number of weeks ahead
-        for week in range(weeks_ahead):
-            for day in range(7):
-                current_date = start_date + timedelta(days=(week * 7 + day))
-                weekday = current_date.weekday()
-
-                if weekday in weekly_schedule:
-                    for hour_entry in weekly_schedule[weekday]:
-                        if isinstance(hour_entry, (tuple, list)):
-                            h = int(hour_entry[0])
-                            m = int(hour_entry[1]) if len(hour_entry) > 1 else 0
-                        else:
-                            h = int(hour_entry)
-                            m = 0
-
-                        slot_time = current_date.replace(hour=h, minute=m, second=0, microsecond=0)
-
-                        # Only add future slots (compare in Eastern time)
-                        if slot_time > self.tz.get_eastern_now():
-                            # Generate slot ID with tutor_id to prevent conflicts
-                            base_slot_id = slot_time.strftime('%Y%m%d%H%M')
-                            slot_id = f"{base_slot_id}_{tutor_id}" if tutor_id else base_slot_id
-
-                            slot_data = {
-                                'id': slot_id,
-                                'datetime': slot_time.isoformat(),
-                                'day': slot_time.strftime('%A'),
-                                'date': slot_time.strftime('%B %d, %Y'),
-                                'time': slot_time.strftime('%I:%M %p'),
-                                'booked': False,
-                                'booked_by': None,
-                                'room': None,
-                                'location_type': location_type,
-                                'location_value': location_value
-                            }
-
-                            # Add tutor information if provided
-                            if tutor_id:
-                                slot_data['tutor_id'] = tutor_id
-                            if tutor_name:
-                                slot_data['tutor_name'] = tutor_name
-                                print(f"[DEBUG] Setting tutor_name to: {tutor_name} for slot {slot_id}")
-                            if tutor_email:
-                                slot_data['tutor_email'] = tutor_email
-
-                            slots.append(slot_data)
-
+        # Normalize each weekday's entries to (hour, minute, time label) once,
+        # rather than re-parsing them for every week
+        schedule_times = {}
+        for weekday, hour_entries in weekly_schedule.items():
+            times = []
+            for hour_entry in hour_entries:
+                if isinstance(hour_entry, (tuple, list)):
+                    h = int(hour_entry[0])
+                    m = int(hour_entry[1]) if len(hour_entry) > 1 else 0
+                else:
+                    h = int(hour_entry)
+                    m = 0
+                times.append((h, m, f"{(h - 1) % 12 + 1:02d}:{m:02d} {'AM' if h < 12 else 'PM'}"))
+            schedule_times[weekday] = times
+
+        # Tutor fields are the same for every slot; only include the ones provided
+        tutor_fields = {key: value for key, value in (('tutor_id', tutor_id),
+                                                      ('tutor_name', tutor_name),
+                                                      ('tutor_email', tutor_email)) if value}
+
+        # Generate slots for specified number of weeks ahead; weekdays follow from
+        # the start date, so unscheduled days are skipped without building a date
+        start_weekday = start_date.weekday()
+        for offset in range(weeks_ahead * 7):
+            weekday = (start_weekday + offset) % 7
+            if weekday not in schedule_times:
+                continue
+
+            current_date = start_date + timedelta(days=offset)
+
+            for h, m, time_label in schedule_times[weekday]:
+                slot_time = current_date.replace(hour=h, minute=m, second=0, microsecond=0)
+
+                # Only add future slots (compare in Eastern time)
+                if slot_time > now_eastern:
+                    y, mo, d = slot_time.year, slot_time.month, slot_time.day
+
+                    # Generate slot ID with tutor_id to prevent conflicts
+                    base_slot_id = f"{y:04d}{mo:02d}{d:02d}{h:02d}{m:02d}"
+                    slot_id = f"{base_slot_id}_{tutor_id}" if tutor_id else base_slot_id
+
+                    slot_data = {
+                        'id': slot_id,
+                        'datetime': slot_time.isoformat(),
+                        'day': _WEEKDAYS[weekday],
+                        'date': f"{_MONTHS[mo - 1]} {d:02d}, {y}",
+                        'time': time_label,
+                        'booked': False,
+                        'booked_by': None,
+                        'room': None,
+                        'location_type': location_type,
+                        'location_value': location_value,
+                        **tutor_fields
+                    }
+
+                    slots.append(slot_data)
+
+        print(f"Generated {len(slots)} slot(s) for tutor={tutor_id} ({tutor_name})")
         return slots
 
     def auto_cleanup_and_generate(self) -> bool:
@@ -132,7 +169,7 @@ class SlotService:
             bool: True if successful, False otherwise
         """
         try:
-            all_slots = self.db.get_all_slots()
+            all_slots = self.db.get_all_slots_cached()
             now_eastern = self.tz.get_eastern_now()
 
             # Count past and future slots (based on Eastern time)
@@ -141,17 +178,17 @@ class SlotService:
             
             for slot in all_slots:
                 slot_datetime_str = slot.get('datetime', '')
-                try:
-                    # Convert slot time to Eastern
-                    slot_datetime_eastern = self.tz.get_eastern_datetime(slot_datetime_str)
-                    
-                    if slot_datetime_eastern and slot_datetime_eastern < now_eastern:
-                        past_slots.append(slot)
-                    else:
-                        future_slots.append(slot)
-                except:
-                    # If parsing fails, treat as past (safe deletion)
+                # Convert slot time to Eastern (None when missing or unparseable)
+                slot_datetime_eastern = self._parse_eastern(slot_datetime_str) if slot_datetime_str else None
+
+                if slot_datetime_eastern is None:
+                    # Missing or unparseable datetime: keep the slot rather than delete it
+                    print(f"WARNING: Slot {slot.get('id')} has no parseable datetime; skipped by cleanup")
+                    future_slots.append(slot)
+                elif slot_datetime_eastern < now_eastern:
                     past_slots.append(slot)
+                else:
+                    future_slots.append(slot)
 
             # Delete all past slots (both booked and unbooked)
             deleted_count = 0
@@ -192,41 +229,17 @@ class SlotService:
         try:
             print("Checking for meetings today to send reminders...")
 
-            # Get all bookings
-            bookings = self.db.get_all_bookings()
-
             # Get today's date in Eastern time
             today = self.tz.get_eastern_now().date()
 
-            reminders_sent = 0
-            for booking in bookings:
-                slot_details = booking.get('slot_details', {})
-                slot_datetime_str = slot_details.get('datetime', '')
+            # Fetch only bookings scheduled today (slot datetimes are Eastern ISO strings)
+            bookings = self.db.get_bookings_in_range(today.isoformat(),
+                                                     (today + timedelta(days=1)).isoformat())
 
-                if not slot_datetime_str:
-                    continue
-
-                # Parse the slot datetime and convert to Eastern
-                try:
-                    slot_datetime_eastern = self.tz.get_eastern_datetime(slot_datetime_str)
-                    if not slot_datetime_eastern:
-                        continue
-                        
-                    slot_date = slot_datetime_eastern.date()
-
-                    # Check if booking is today (Eastern time)
-                    if slot_date == today:
-                        # Send reminder email
-                        print(f"Sending reminder to {booking['full_name']} for session at {slot_details.get('time')} Eastern")
-                        success = EmailService.send_meeting_reminder(booking)
-                        if success:
-                            reminders_sent += 1
-                            print(f"[OK] Reminder sent to {booking['email']}")
-                        else:
-                            print(f"[ERROR] Failed to send reminder to {booking['email']}")
-                except Exception as e:
-                    print(f"Error parsing datetime for booking {booking.get('id')}: {e}")
-                    continue
+            # SMTP sends are network-bound, so send them concurrently
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                results = list(executor.map(self._send_reminder, bookings))
+            reminders_sent = sum(1 for success in results if success)
 
             print(f"Meeting reminder check complete. Sent {reminders_sent} reminder(s).")
             return reminders_sent
@@ -235,23 +248,52 @@ class SlotService:
             print(f"ERROR: Error in check_and_send_meeting_reminders: {e}")
             return 0
 
+    @staticmethod
+    def _send_reminder(booking: Dict) -> bool:
+        """
+        Send a single meeting reminder (runs on a worker thread)
+
+        Args:
+            booking: Booking dictionary
+
+        Returns:
+            bool: True if the reminder was sent successfully
+        """
+        slot_details = booking.get('slot_details', {})
+
+        try:
+            print(f"Sending reminder to {booking['full_name']} for session at {slot_details.get('time')} Eastern")
+            success = EmailService.send_meeting_reminder(booking)
+            if success:
+                print(f"[OK] Reminder sent to {booking['email']}")
+            else:
+                print(f"[ERROR] Failed to send reminder to {booking['email']}")
+            return success
+        except Exception as e:
+            print(f"Error sending reminder for booking {booking.get('id')}: {e}")
+            return False
+
     def morning_reminder_scheduler(self) -> None:
         """Background thread that sends reminders at 8:30 AM Eastern every day"""
         while True:
             try:
-                # Get Eastern time
+                # Sleep until the next 8:30 AM Eastern instead of polling
                 now = self.tz.get_eastern_now()
+                next_run = now.replace(hour=8, minute=30, second=0, microsecond=0)
+                if next_run <= now:
+                    next_run += timedelta(days=1)
 
-                # Check if it's 8:30 AM Eastern (or between 8:30-8:31)
-                if now.hour == 8 and now.minute == 30:
-                    print(f"=== Running morning reminder scheduler at 8:30 AM Eastern (actual time: {now}) ===")
-                    self.check_and_send_meeting_reminders()
+                # Subtracting two datetimes that share a ZoneInfo gives wall-clock time, which is
+                # off by an hour across a DST change; compare absolute timestamps instead
+                time.sleep(max(0.0, next_run.timestamp() - now.timestamp()))
 
-                    # Sleep for 60 seconds to avoid sending multiple times
-                    time.sleep(60)
+                # Woke slightly early (timer or clock skew) - re-arm for the correct time
+                now = self.tz.get_eastern_now()
+                if (now.hour, now.minute) < (8, 30):
+                    continue
 
-                # Check every 30 seconds
-                time.sleep(30)
+                print(f"=== Running morning reminder scheduler at 8:30 AM Eastern (actual time: {now}) ===")
+                self.check_and_send_meeting_reminders()
 
             except Exception as e:
                 print(f"ERROR: Exception in morning_reminder_scheduler: {e}")
@@ -267,15 +309,8 @@ class SlotService:
         Returns:
             List of available slot dictionaries
         """
-        all_slots = self.db.get_all_slots()
-        available = [s for s in all_slots if not s.get('booked', False)]
-        
-        # Sort by datetime
-        available.sort(key=lambda x: x.get('datetime', ''))
-        
-        if limit:
-            return available[:limit]
-        return available
+        # Filtered from the datetime-ordered slot list
+        return self.db.get_available_slots_raw(limit)
 
     def get_slot_by_id(self, slot_id: str) -> Optional[Dict]:
         """
@@ -287,11 +322,7 @@ class SlotService:
         Returns:
             Slot dictionary or None if not found
         """
-        slots = self.db.get_all_slots()
-        for slot in slots:
-            if slot.get('id') == slot_id:
-                return slot
-        return None
+        return self.db.get_slot(slot_id)
 
     def book_slot(self, slot_id: str, user_email: str, room: str) -> bool:
         """
@@ -331,20 +362,21 @@ class SlotService:
         """
         return self.db.delete_slot(slot_id)
 
-    def get_slots_summary(self) -> Dict:
+    def get_slots_summary(self) -> Optional[Dict]:
         """
         Get summary statistics about slots
         
         Returns:
-            Dictionary with total, available, booked counts
+            Dictionary with total, available, booked counts, or None if
+            either count query failed
         """
-        all_slots = self.db.get_all_slots()
-        total = len(all_slots)
-        booked = sum(1 for s in all_slots if s.get('booked', False))
-        available = total - booked
-        
+        total = self.db.count_slots()
+        booked = self.db.count_slots(booked_only=True)
+        if total is None or booked is None:
+            return None
+
         return {
             'total': total,
-            'available': available,
+            'available': total - booked,
             'booked': booked
         }
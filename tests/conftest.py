@@ -12,21 +12,37 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app import app as flask_app
 
 
-@pytest.fixture
+def _worker_remote_addr():
+    """
+    Client address for this pytest-xdist worker.
+
+    Rate-limit counters are keyed by client IP, so each worker uses its own
+    loopback address to keep workers from exhausting each other's limits.
+    """
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+    index = int(worker[2:]) if worker[2:].isdigit() else 0
+    return f'127.0.0.{index + 1}'
+
+
+@pytest.fixture(scope='session')
 def app():
-    """Create application for testing."""
+    """Create application for testing (shared across the whole session)."""
     flask_app.config.update({
         'TESTING': True,
         'WTF_CSRF_ENABLED': False,
-        'SECRET_KEY': 'test-secret-key'
+        'SECRET_KEY': 'test-secret-key',
+        # Never call Google's reCAPTCHA endpoint from tests
+        'RECAPTCHA_VERIFIER': lambda _token: (True, 0.9, None)
     })
     yield flask_app
 
 
 @pytest.fixture
 def client(app):
-    """Create test client."""
-    return app.test_client()
+    """Create a fresh test client (and cookie jar) per test."""
+    test_client = app.test_client()
+    test_client.environ_base['REMOTE_ADDR'] = _worker_remote_addr()
+    return test_client
 
 
 @pytest.fixture
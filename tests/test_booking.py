@@ -34,42 +34,21 @@ class TestBookingCreation:
             data = response.get_json()
             assert data['success'] is False
 
-    def test_booking_validation_full_name(self, authenticated_client):
-        """Test booking validation for full name."""
+    @pytest.mark.parametrize('payload', [
+        # Empty full name
+        {'full_name': '', 'role': 'student', 'selected_slot': 'test',
+         'selected_room': 'Test Room', 'device_id': 'test123'},
+        # Empty role
+        {'full_name': 'Test User', 'role': '', 'selected_slot': 'test',
+         'selected_room': 'Test Room', 'device_id': 'test123'},
+        # Missing device_id (required for rate limiting)
+        {'full_name': 'Test User', 'role': 'student', 'selected_slot': 'test',
+         'selected_room': 'Test Room'},
+    ], ids=['full_name', 'role', 'device_id'])
+    def test_booking_validation(self, authenticated_client, payload):
+        """Test booking validation rejects incomplete submissions."""
         response = authenticated_client.post('/api/booking/request-verification',
-                                            json={
-                                                'full_name': '',
-                                                'role': 'student',
-                                                'selected_slot': 'test',
-                                                'selected_room': 'Test Room',
-                                                'device_id': 'test123'
-                                            })
-        # 400 for validation error, 429 if rate limited
-        assert response.status_code in [400, 429]
-
-    def test_booking_validation_role(self, authenticated_client):
-        """Test booking validation for role."""
-        response = authenticated_client.post('/api/booking/request-verification',
-                                            json={
-                                                'full_name': 'Test User',
-                                                'role': '',
-                                                'selected_slot': 'test',
-                                                'selected_room': 'Test Room',
-                                                'device_id': 'test123'
-                                            })
-        # 400 for validation error, 429 if rate limited
-        assert response.status_code in [400, 429]
-
-    def test_booking_validation_device_id(self, authenticated_client):
-        """Test booking requires device ID for rate limiting."""
-        response = authenticated_client.post('/api/booking/request-verification',
-                                            json={
-                                                'full_name': 'Test User',
-                                                'role': 'student',
-                                                'selected_slot': 'test',
-                                                'selected_room': 'Test Room'
-                                                # Missing device_id
-                                            })
+                                            json=payload)
         # 400 for validation error, 429 if rate limited
         assert response.status_code in [400, 429]
 
@@ -96,35 +75,18 @@ class TestBookingManagement:
 class TestDeprecatedEndpoints:
     """Test deprecated booking endpoints."""
 
-    def test_confirm_verification_deprecated(self, client):
-        """Test that confirm verification endpoint is deprecated."""
-        response = client.post('/api/booking/confirm-verification', json={})
-        # 410 for deprecated, 429 if rate limited
-        assert response.status_code in [410, 429]
-
-    def test_booking_lookup_deprecated(self, client):
-        """Test that booking lookup endpoint is deprecated."""
-        response = client.post('/api/booking/lookup', json={})
-        # 410 for deprecated, 429 if rate limited
-        assert response.status_code in [410, 429]
-
-    def test_booking_verify_deprecated(self, client):
-        """Test that booking verify endpoint is deprecated."""
-        response = client.post('/api/booking/verify', json={})
-        # 410 for deprecated, 429 if rate limited
-        assert response.status_code in [410, 429]
-
-    def test_delete_by_email_deprecated(self, client):
-        """Test that delete by email endpoint is deprecated."""
-        response = client.post('/api/booking/delete-by-email', json={})
-        # 410 for deprecated, 429 if rate limited
-        assert response.status_code in [410, 429]
-
-    def test_update_by_email_deprecated(self, client):
-        """Test that update by email endpoint is deprecated."""
-        response = client.post('/api/booking/update-by-email', json={})
-        # 401 if not authenticated, 410 for deprecated, 429 if rate limited
-        assert response.status_code in [401, 410, 429]
+    @pytest.mark.parametrize('endpoint, expected_statuses', [
+        ('/api/booking/confirm-verification', [410, 429]),
+        ('/api/booking/lookup', [410, 429]),
+        ('/api/booking/verify', [410, 429]),
+        ('/api/booking/delete-by-email', [410, 429]),
+        # 401 if not authenticated
+        ('/api/booking/update-by-email', [401, 410, 429]),
+    ])
+    def test_endpoint_deprecated(self, client, endpoint, expected_statuses):
+        """Test that deprecated endpoints return 410 (or 429 if rate limited)."""
+        response = client.post(endpoint, json={})
+        assert response.status_code in expected_statuses
 
 
 class TestUserBooking:
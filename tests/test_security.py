@@ -3,8 +3,12 @@ Security tests for LearnAI booking system.
 Tests input validation, XSS prevention, rate limiting, and CSRF protection.
 """
 
+import types
+
 import pytest
 
+from utils import security_utils
+
 
 class TestInputValidation:
     """Test input validation and sanitization."""
@@ -207,3 +211,106 @@ class TestContactForm:
         })
         # Should sanitize or reject, 500 if email not configured in CI
         assert response.status_code in [200, 400, 500]
+
+
+class TestRecaptchaCircuitBreaker:
+    """Test the reCAPTCHA circuit breaker states."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable monotonic clock for the breaker."""
+        now = [1000.0]
+        monkeypatch.setattr(security_utils, 'time', types.SimpleNamespace(monotonic=lambda: now[0]))
+        return now
+
+    @staticmethod
+    def _tripped_breaker():
+        breaker = security_utils._Breaker(threshold=3, cooldown=30.0)
+        for _ in range(3):
+            breaker.record_failure()
+        return breaker
+
+    def test_closed_below_threshold(self, clock):
+        """Test that failures below the threshold keep the circuit closed."""
+        breaker = security_utils._Breaker(threshold=3, cooldown=30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert not breaker.is_open()
+
+    def test_success_resets_failure_count(self, clock):
+        """Test that a success clears earlier failures."""
+        breaker = security_utils._Breaker(threshold=3, cooldown=30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open()
+
+    def test_opens_at_threshold_until_cooldown(self, clock):
+        """Test that the circuit opens at the threshold and stays open during the cooldown."""
+        breaker = self._tripped_breaker()
+        assert breaker.is_open()
+        clock[0] += 29
+        assert breaker.is_open()
+
+    def test_half_open_allows_single_probe(self, clock):
+        """Test that only one caller is let through after the cooldown."""
+        breaker = self._tripped_breaker()
+        clock[0] += 30
+        assert not breaker.is_open()
+        assert breaker.is_open()
+        assert breaker.is_open()
+
+    def test_probe_success_closes_circuit(self, clock):
+        """Test that a successful probe closes the circuit."""
+        breaker = self._tripped_breaker()
+        clock[0] += 30
+        assert not breaker.is_open()
+        breaker.record_success()
+        assert not breaker.is_open()
+        assert not breaker.is_open()
+
+    def test_probe_failure_reopens_for_full_cooldown(self, clock):
+        """Test that a failed probe re-opens the circuit for another cooldown."""
+        breaker = self._tripped_breaker()
+        clock[0] += 30
+        assert not breaker.is_open()
+        breaker.record_failure()
+        clock[0] += 29
+        assert breaker.is_open()
+        clock[0] += 1
+        assert not breaker.is_open()
+
+    def test_stale_probe_is_rearmed(self, clock):
+        """Test that a probe that never reports back does not wedge the circuit open."""
+        breaker = self._tripped_breaker()
+        clock[0] += 30
+        assert not breaker.is_open()
+        clock[0] += 30
+        assert not breaker.is_open()
+
+
+class TestRecaptchaVerification:
+    """Test reCAPTCHA verifier selection."""
+
+    def test_configured_verifier_is_used(self, app):
+        """Test that app.config['RECAPTCHA_VERIFIER'] replaces the Google call."""
+        with app.app_context():
+            assert security_utils.verify_recaptcha('token') == (True, 0.9, None)
+
+    def test_missing_token_skips_verification(self):
+        """Test that an empty token is treated as optional outside an app context."""
+        assert security_utils.verify_recaptcha('') == (None, 0.0, None)
+
+    def test_open_circuit_skips_google(self, monkeypatch):
+        """Test that an open circuit returns without calling Google."""
+        breaker = security_utils._Breaker(threshold=1, cooldown=30.0)
+        breaker.record_failure()
+        monkeypatch.setattr(security_utils, '_recaptcha_breaker', breaker)
+        monkeypatch.setenv('RECAPTCHA_SECRET_KEY', 'test-secret')
+
+        def fail_post(*args, **kwargs):
+            raise AssertionError('siteverify should not be called while the circuit is open')
+
+        monkeypatch.setattr(security_utils._RECAPTCHA_SESSION, 'post', fail_post)
+        assert security_utils.verify_recaptcha('token') == (None, 0.0, 'circuit_open')
@@ -3,11 +3,24 @@ DateTime Utilities Module
 Handles Eastern timezone conversions and datetime formatting.
 """
 
-from datetime import datetime
-import pytz
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+try:
+    # C-accelerated ISO 8601 parser (optional dependency)
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+logger = logging.getLogger(__name__)
 
 # Eastern timezone
-EASTERN_TZ = pytz.timezone('America/New_York')
+EASTERN_TZ = ZoneInfo('America/New_York')
+
+# UTC (naive datetimes are assumed to be UTC)
+UTC_TZ = timezone.utc
 
 
 def get_eastern_now() -> datetime:
@@ -20,6 +33,30 @@ def get_eastern_now() -> datetime:
     return datetime.now(EASTERN_TZ)
 
 
+@lru_cache(maxsize=4096)
+def _parse_eastern_cached(datetime_str: str) -> datetime:
+    """
+    Parse an ISO datetime string and convert it to Eastern (memoized)
+
+    The same slot strings are parsed on many requests, so results are cached.
+    Raises on invalid input; failures are not cached.
+    """
+    # Parse ISO format datetime
+    dt = _parse_iso(datetime_str)
+
+    # If naive, assume UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC_TZ)
+
+    # Stored slots usually already carry the Eastern offset (-05:00/-04:00) for
+    # their wall time; re-tag them instead of converting
+    elif dt.utcoffset() == EASTERN_TZ.utcoffset(dt):
+        return dt.replace(tzinfo=EASTERN_TZ)
+
+    # Convert to Eastern
+    return dt.astimezone(EASTERN_TZ)
+
+
 def get_eastern_datetime(datetime_str: str) -> datetime:
     """
     Convert ISO datetime string to Eastern timezone
@@ -31,19 +68,10 @@ def get_eastern_datetime(datetime_str: str) -> datetime:
         datetime: Datetime in Eastern timezone (aware) or None if parsing fails
     """
     try:
-        # Parse ISO format datetime
-        dt = datetime.fromisoformat(datetime_str)
-        
-        # If naive, assume UTC
-        if dt.tzinfo is None:
-            dt = pytz.utc.localize(dt)
-        
-        # Convert to Eastern
-        eastern_dt = dt.astimezone(EASTERN_TZ)
-        return eastern_dt
+        return _parse_eastern_cached(datetime_str)
         
     except Exception as e:
-        print(f"Error converting datetime to Eastern: {e}")
+        logger.warning("Error converting datetime to Eastern: %s", e)
         return None
 
 
@@ -59,16 +87,20 @@ def format_datetime_eastern(dt: datetime, format_str: str = '%Y-%m-%d %I:%M %p %
         str: Formatted datetime string in Eastern time
     """
     try:
+        # Already in Eastern, no conversion needed
+        if dt.tzinfo is EASTERN_TZ:
+            return dt.strftime(format_str)
+
         # If naive, assume UTC
         if dt.tzinfo is None:
-            dt = pytz.utc.localize(dt)
+            dt = dt.replace(tzinfo=UTC_TZ)
         
         # Convert to Eastern
         eastern_dt = dt.astimezone(EASTERN_TZ)
         return eastern_dt.strftime(format_str)
         
     except Exception as e:
-        print(f"Error formatting datetime: {e}")
+        logger.warning("Error formatting datetime: %s", e)
         return str(dt)
 
 
@@ -115,3 +147,18 @@ def get_time_until(datetime_str: str) -> int:
         
     except Exception:
         return -1
+
+
+class TimezoneUtil:
+    """Eastern-time helpers bundled for injection into services (e.g. SlotService)"""
+
+    # Shared Eastern tzinfo, resolved once at import
+    eastern = EASTERN_TZ
+
+    @staticmethod
+    def get_eastern_now() -> datetime:
+        return get_eastern_now()
+
+    @staticmethod
+    def get_eastern_datetime(dt_str: str) -> datetime:
+        return get_eastern_datetime(dt_str)
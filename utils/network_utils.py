@@ -3,7 +3,10 @@ Network Utilities Module
 Handles IP address detection and network-related functions.
 """
 
-from flask import request
+from functools import lru_cache
+from ipaddress import ip_address
+
+from flask import g, request
 
 
 def get_client_ip() -> str:
@@ -13,22 +16,42 @@ def get_client_ip() -> str:
     Returns:
         str: Client's IP address
     """
+    # Resolved once per request (rate limiting and logging both ask for it)
+    if 'client_ip' in g:
+        return g.client_ip
+
+    headers = request.headers
+
     # Check common proxy headers in order of reliability
-    if request.headers.get('X-Forwarded-For'):
+    forwarded_for = headers.get('X-Forwarded-For')
+    if forwarded_for:
         # X-Forwarded-For can contain multiple IPs, take the first one
-        ip = request.headers.get('X-Forwarded-For').split(',')[0].strip()
-        return ip
-    elif request.headers.get('X-Real-IP'):
-        return request.headers.get('X-Real-IP')
-    elif request.headers.get('CF-Connecting-IP'):  # Cloudflare
-        return request.headers.get('CF-Connecting-IP')
+        ip = forwarded_for.partition(',')[0].strip()
     else:
-        return request.remote_addr
+        ip = (headers.get('X-Real-IP')
+              or headers.get('CF-Connecting-IP')  # Cloudflare
+              or request.remote_addr)
+
+    g.client_ip = ip
+    return ip
+
+
+# (singular, plural) unit names, indexed by count != 1
+_MINUTE_UNITS = ('minute', 'minutes')
+_HOUR_UNITS = ('hour', 'hours')
+
+
+def _pluralize(count: int, units: tuple) -> str:
+    """Format a count with its singular/plural unit name."""
+    return f"{count} {units[count != 1]}"
 
 
+@lru_cache(maxsize=2048)
 def format_wait_time(minutes: int) -> str:
     """
     Format wait time in a human-readable format
+
+    Results are cached, so pass plain ints (e.g. not numpy integers).
     
     Args:
         minutes: Number of minutes to wait
@@ -37,15 +60,15 @@ def format_wait_time(minutes: int) -> str:
         str: Formatted wait time (e.g., "2 hours", "45 minutes")
     """
     if minutes < 60:
-        return f"{minutes} minute{'s' if minutes != 1 else ''}"
+        return _pluralize(minutes, _MINUTE_UNITS)
     
     hours = minutes // 60
     remaining_mins = minutes % 60
     
     if remaining_mins == 0:
-        return f"{hours} hour{'s' if hours != 1 else ''}"
+        return _pluralize(hours, _HOUR_UNITS)
     
-    return f"{hours} hour{'s' if hours != 1 else ''} {remaining_mins} minute{'s' if remaining_mins != 1 else ''}"
+    return f"{_pluralize(hours, _HOUR_UNITS)} {_pluralize(remaining_mins, _MINUTE_UNITS)}"
 
 
 def is_localhost(ip: str) -> bool:
@@ -56,15 +79,21 @@ def is_localhost(ip: str) -> bool:
         ip: IP address string
         
     Returns:
-        bool: True if localhost, False otherwise
+        bool: True if localhost (any loopback address), False otherwise
     """
-    localhost_ips = ['127.0.0.1', '::1', 'localhost']
-    return ip in localhost_ips
+    if ip == 'localhost':
+        return True
+
+    try:
+        return ip_address(ip).is_loopback
+    except ValueError:
+        return False
 
 
+@lru_cache(maxsize=8192)
 def is_private_ip(ip: str) -> bool:
     """
-    Check if IP address is in a private range
+    Check if IP address is in a private range (IPv4 or IPv6)
     
     Args:
         ip: IP address string
@@ -73,18 +102,6 @@ def is_private_ip(ip: str) -> bool:
         bool: True if private IP, False otherwise
     """
     try:
-        parts = ip.split('.')
-        if len(parts) != 4:
-            return False
-        
-        # Check private IP ranges
-        if parts[0] == '10':
-            return True
-        if parts[0] == '172' and 16 <= int(parts[1]) <= 31:
-            return True
-        if parts[0] == '192' and parts[1] == '168':
-            return True
-        
-        return False
-    except Exception:
+        return ip_address(ip).is_private
+    except ValueError:
         return False
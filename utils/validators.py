@@ -3,9 +3,35 @@ Input Validation and Sanitization Utilities
 Provides secure input validation for corporate-grade security
 """
 
-import re
-from typing import Any, Optional, Tuple
-from html import escape
+import uuid
+from typing import Any, Collection, Optional, Tuple
+
+# google-re2 gives linear-time matching on untrusted input; fall back to the stdlib engine
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+# Null bytes removed, HTML special characters escaped exactly as html.escape(quote=True) does
+_SANITIZE_TABLE = str.maketrans({
+    '\x00': None,
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+_ALLOWED_ROLES = frozenset({'student', 'teacher', 'advisor', 'faculty', 'staff', 'other'})
+_ALLOWED_MEETING_TYPES = frozenset({'zoom', 'in-person'})
+# Phone formatting characters: every whitespace code point regex \s matches, plus -().
+_PHONE_STRIP = str.maketrans('', '', (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+    '-().'
+))
+_TRUTHY = frozenset({'true', '1', 'yes', 'on', 'True', 'TRUE', 'Yes', 'YES', 'On', 'ON'})
 
 
 class InputValidator:
@@ -16,6 +42,8 @@ class InputValidator:
     PHONE_PATTERN = re.compile(r'^\+?1?\d{9,15}$')  # International phone format
     NAME_PATTERN = re.compile(r'^[a-zA-Z\s\-\.\']{2,100}$')
     ALPHANUMERIC_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_]{1,255}$')
+    SLOT_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+    DEVICE_ID_PATTERN = re.compile(r'^[a-zA-Z0-9\-_]+$')
 
     # Max lengths for different field types
     MAX_LENGTH_NAME = 100
@@ -30,7 +58,7 @@ class InputValidator:
         Sanitize string input by escaping HTML and limiting length
 
         Args:
-            value: Input value to sanitize
+            value: Input value to sanitize (bytes are decoded as UTF-8)
             max_length: Maximum allowed length
 
         Returns:
@@ -39,20 +67,35 @@ class InputValidator:
         if value is None:
             return ''
 
-        # Convert to string and strip whitespace
-        sanitized = str(value).strip()
-
-        # Remove null bytes (security risk)
-        sanitized = sanitized.replace('\x00', '')
-
-        # Escape HTML to prevent XSS
-        sanitized = escape(sanitized)
+        if isinstance(value, (bytes, bytearray)):
+            # Drop null bytes while still in bytes form, then decode
+            sanitized = value.translate(None, b'\x00').decode('utf-8', 'replace').strip()
+        else:
+            sanitized = str(value).strip()
 
-        # Limit length
+        # Limit length before escaping so entities are never cut in half
         if len(sanitized) > max_length:
             sanitized = sanitized[:max_length]
 
-        return sanitized
+        # Drop null bytes (security risk) and escape HTML to prevent XSS in a single pass
+        return sanitized.translate(_SANITIZE_TABLE)
+
+    @staticmethod
+    def sanitize_safe_alnum(value: str, max_length: int) -> str:
+        """
+        Limit the length of a value whose validator already restricted it to HTML-safe characters
+
+        Only use this after a validator that rejects null bytes and HTML special characters
+        (slot IDs, device IDs, phone numbers). The value must already be stripped.
+
+        Args:
+            value: Validated input value
+            max_length: Maximum allowed length
+
+        Returns:
+            Truncated string
+        """
+        return value[:max_length]
 
     @staticmethod
     def validate_email(email: str) -> Tuple[bool, str]:
@@ -73,6 +116,15 @@ class InputValidator:
         if len(email) > InputValidator.MAX_LENGTH_EMAIL:
             return False, "Email address is too long"
 
+        # Cheap structural checks first: exactly one '@' with text on both sides and a dot in the domain
+        at = email.find('@')
+        if at < 1 or at == len(email) - 1 or email.find('@', at + 1) != -1:
+            return False, "Invalid email format"
+
+        dot = email.find('.', at)
+        if dot == -1 or dot == len(email) - 1:
+            return False, "Invalid email format"
+
         if not InputValidator.EMAIL_PATTERN.match(email):
             return False, "Invalid email format"
 
@@ -123,8 +175,8 @@ class InputValidator:
                 return False, "Phone number is required"
             return True, ""  # Optional field
 
-        # Remove common phone formatting characters
-        cleaned = re.sub(r'[\s\-\(\)\.]+', '', phone.strip())
+        # Remove common phone formatting characters (surrounding whitespace included)
+        cleaned = phone.translate(_PHONE_STRIP)
 
         if not InputValidator.PHONE_PATTERN.match(cleaned):
             return False, "Invalid phone number format"
@@ -132,13 +184,13 @@ class InputValidator:
         return True, ""
 
     @staticmethod
-    def validate_choice(value: str, allowed_choices: list, field_name: str = "Field") -> Tuple[bool, str]:
+    def validate_choice(value: str, allowed_choices: Collection, field_name: str = "Field") -> Tuple[bool, str]:
         """
         Validate that value is in allowed choices
 
         Args:
             value: Value to validate
-            allowed_choices: List of allowed values
+            allowed_choices: Allowed values (a frozenset gives O(1) lookups)
             field_name: Name of the field for error messages
 
         Returns:
@@ -173,9 +225,13 @@ class InputValidator:
                 return False, f"{field_name} is required"
             return True, ""  # Optional field
 
-        text = text.strip()
         text_length = len(text)
 
+        # Stripping never lengthens text, so only measure a stripped copy when there is edge
+        # whitespace and the raw length alone can't settle the bounds
+        if (text_length > max_length or min_length > 0) and (text[0].isspace() or text[-1].isspace()):
+            text_length = len(text.strip())
+
         if text_length < min_length:
             return False, f"{field_name} must be at least {min_length} characters"
 
@@ -227,7 +283,8 @@ class InputValidator:
             return value
 
         if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
+            # Common spellings hit the set directly; only unusual casing pays for lower()
+            return value in _TRUTHY or value.lower() in _TRUTHY
 
         return bool(value)
 
@@ -248,7 +305,7 @@ class InputValidator:
         slot_id = slot_id.strip()
 
         # Slot IDs should be alphanumeric with underscores (format: YYYYMMDDHHMI_tutorID)
-        if not re.match(r'^[a-zA-Z0-9_]+$', slot_id):
+        if not InputValidator.SLOT_ID_PATTERN.match(slot_id):
             return False, "Invalid slot ID format"
 
         if len(slot_id) > 100:
@@ -270,76 +327,20 @@ class InputValidator:
         errors = []
         sanitized = {}
 
-        # Validate and sanitize full_name
-        full_name = data.get('full_name') or ''
-        full_name = full_name.strip() if full_name else ''
-        is_valid, error = InputValidator.validate_name(full_name, "Full name")
-        if not is_valid:
-            errors.append(error)
-        else:
-            sanitized['full_name'] = InputValidator.sanitize_string(full_name, InputValidator.MAX_LENGTH_NAME)
-
-        # Validate role
-        allowed_roles = ['student', 'teacher', 'advisor', 'faculty', 'staff', 'other']
-        role = data.get('role') or ''
-        role = role.strip().lower() if role else ''
-        is_valid, error = InputValidator.validate_choice(role, allowed_roles, "Role")
-        if not is_valid:
-            errors.append(error)
-        else:
-            sanitized['role'] = role
-
-        # Validate slot ID
-        slot_id = data.get('selected_slot') or ''
-        slot_id = slot_id.strip() if slot_id else ''
-        is_valid, error = InputValidator.validate_slot_id(slot_id)
-        if not is_valid:
-            errors.append(error)
-        else:
-            sanitized['selected_slot'] = slot_id
-
-        # Validate room (required)
-        room = data.get('selected_room') or ''
-        room = room.strip() if room else ''
-        is_valid, error = InputValidator.validate_text_length(room, min_length=1, max_length=100,
-                                                              field_name="Room selection")
-        if not is_valid:
-            errors.append(error)
-        else:
-            sanitized['selected_room'] = InputValidator.sanitize_string(room, 100)
-
-        # Optional fields with sanitization
-        optional_text_fields = {
-            'department': 255,
-            'ai_familiarity': 255,
-            'ai_tools': 500,
-            'primary_use': 500,
-            'learning_goal': 1000,
-            'personal_comments': InputValidator.MAX_LENGTH_COMMENT
-        }
-
-        for field, max_len in optional_text_fields.items():
-            value = data.get(field) or ''
-            value = value.strip() if value else ''
-            if value:
-                is_valid, error = InputValidator.validate_text_length(value, max_length=max_len,
-                                                                      field_name=field.replace('_', ' ').title(),
-                                                                      required=False)
-                if not is_valid:
-                    errors.append(error)
-                else:
-                    sanitized[field] = InputValidator.sanitize_string(value, max_len)
+        # Optional fields default to '' so only submitted values need validating
+        sanitized.update(_OPTIONAL_BOOKING_FIELDS)
+
+        # Text fields share one get/strip/validate/sanitize pass (see _BOOKING_TEXT_SCHEMA)
+        for field, normalize, validator, sanitize in _BOOKING_TEXT_SCHEMA:
+            value = data.get(field)
+            value = normalize(value) if value else ''
+            if not value and field in _OPTIONAL_BOOKING_FIELDS:
+                continue
+            is_valid, error = validator(value)
+            if not is_valid:
+                errors.append(error)
             else:
-                sanitized[field] = ''
-
-        # Validate phone (optional)
-        phone = data.get('phone') or ''
-        phone = phone.strip() if phone else ''
-        is_valid, error = InputValidator.validate_phone(phone, required=False)
-        if not is_valid:
-            errors.append(error)
-        else:
-            sanitized['phone'] = InputValidator.sanitize_string(phone, 20)
+                sanitized[field] = sanitize(value)
 
         # Validate confidence level
         confidence = data.get('confidence_level', 3)
@@ -358,20 +359,18 @@ class InputValidator:
         device_id = device_id.strip() if device_id else ''
         if device_id:
             # Device IDs should be alphanumeric with hyphens and underscores
-            if re.match(r'^[a-zA-Z0-9\-_]+$', device_id) and len(device_id) <= 100:
-                sanitized['device_id'] = device_id
+            if InputValidator.DEVICE_ID_PATTERN.match(device_id) and len(device_id) <= 100:
+                sanitized['device_id'] = InputValidator.sanitize_safe_alnum(device_id, 100)
             else:
                 errors.append("Invalid device ID")
         else:
             # Generate a device ID if not provided (for backwards compatibility)
-            import uuid
             sanitized['device_id'] = f"auto_{uuid.uuid4().hex[:16]}"
 
         # Meeting type validation (zoom or in-person)
         meeting_type = data.get('meeting_type') or 'in-person'
         meeting_type = meeting_type.strip().lower() if meeting_type else 'in-person'
-        allowed_meeting_types = ['zoom', 'in-person']
-        if meeting_type not in allowed_meeting_types:
+        if meeting_type not in _ALLOWED_MEETING_TYPES:
             meeting_type = 'in-person'  # Default to in-person if invalid
         sanitized['meeting_type'] = meeting_type
 
@@ -389,3 +388,59 @@ class InputValidator:
             return False, {}, "; ".join(errors)
 
         return True, sanitized, None
+
+
+def _strip(value: str) -> str:
+    return value.strip()
+
+
+def _lower_strip(value: str) -> str:
+    return value.strip().lower()
+
+
+def _unchanged(value: str) -> str:
+    return value
+
+
+def _escaped(max_len: int):
+    return lambda value: InputValidator.sanitize_string(value, max_len)
+
+
+def _safe(max_len: int):
+    return lambda value: InputValidator.sanitize_safe_alnum(value, max_len)
+
+
+def _optional_text(field: str, max_len: int) -> tuple:
+    label = field.replace('_', ' ').title()
+    return (field, _strip,
+            lambda value: InputValidator.validate_text_length(value, max_length=max_len,
+                                                              field_name=label, required=False),
+            _escaped(max_len))
+
+
+# (field, normalize, validator, sanitize) in the order errors are reported.
+# Fields whose validator restricts them to HTML-safe characters skip the escaping pass. Names
+# still go through sanitize_string because NAME_PATTERN allows apostrophes.
+_BOOKING_TEXT_SCHEMA = (
+    ('full_name', _strip,
+     lambda value: InputValidator.validate_name(value, "Full name"), _escaped(InputValidator.MAX_LENGTH_NAME)),
+    ('role', _lower_strip,
+     lambda value: InputValidator.validate_choice(value, _ALLOWED_ROLES, "Role"), _unchanged),
+    ('selected_slot', _strip, InputValidator.validate_slot_id, _safe(100)),
+    ('selected_room', _strip,
+     lambda value: InputValidator.validate_text_length(value, min_length=1, max_length=100,
+                                                       field_name="Room selection"),
+     _escaped(100)),
+    _optional_text('department', 255),
+    _optional_text('ai_familiarity', 255),
+    _optional_text('ai_tools', 500),
+    _optional_text('primary_use', 500),
+    _optional_text('learning_goal', 1000),
+    _optional_text('personal_comments', InputValidator.MAX_LENGTH_COMMENT),
+    ('phone', _strip, lambda value: InputValidator.validate_phone(value, required=False), _safe(20)),
+)
+
+# Text fields that may be left blank; they are stored as '' when omitted
+_OPTIONAL_BOOKING_FIELDS = dict.fromkeys(
+    ('department', 'ai_familiarity', 'ai_tools', 'primary_use', 'learning_goal', 'personal_comments', 'phone'),
+    '')